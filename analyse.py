@@ -20,19 +20,27 @@
 
 """Module to execute the ABCD Detector Assessment"""
 
+import os
+import copy
 import time
 import traceback
+import contextvars
+import functools
 import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import models
 import utils
 from annotations_evaluation import annotations_generation
 from helpers import generic_helpers
+from helpers import logging_helpers
 from configuration import Configuration
 from creative_providers import creative_provider_proto
 from creative_providers import creative_provider_registry
 from evaluation_services import video_evaluation_service
-import io
-from contextlib import redirect_stdout, redirect_stderr
+
+# Each video makes several concurrent LLM calls, so keep the default small to
+# stay within the Gemini API quota
+VIDEO_MAX_WORKERS = int(os.getenv("ABCD_VIDEO_MAX_WORKERS", "4"))
 
 
 def execute_abcd_assessment_for_videos(config: Configuration):
@@ -44,106 +52,138 @@ def execute_abcd_assessment_for_videos(config: Configuration):
       )
   )
 
-  video_uris = creative_provider.get_creative_uris(config)
+  # The expected uri prefix only depends on the provider, not on each video
+  if config.is_gcs:
+    expected_prefix = "gs://"
+  elif config.is_youtube:
+    expected_prefix = "https://www.youtube.com"
+  else:
+    expected_prefix = ""
+
+  # Videos are independent and mostly wait on GCS and the LLM, so threads
+  # are enough to overlap them
+  tasks = {}
+  with ThreadPoolExecutor(max_workers=VIDEO_MAX_WORKERS) as executor:
+    running_tasks = set()
+    # Uris are consumed lazily so videos start before the listing finishes
+    for video_uri in creative_provider.get_creative_uris(config):
+      # Validate that creative provides match the video uris
+      if expected_prefix and not video_uri.startswith(expected_prefix):
+        logging.error(
+            "The creative provider %s does not match with the video uri %s."
+            " Skipping video. Please check.",
+            config.creative_provider_type.value,
+            video_uri,
+        )
+        continue
+
+      # Keep at most VIDEO_MAX_WORKERS videos in flight
+      if len(running_tasks) >= VIDEO_MAX_WORKERS:
+        _, running_tasks = wait(running_tasks, return_when=FIRST_COMPLETED)
+      # Copy the context so the video logs are captured by the caller
+      task = executor.submit(
+          contextvars.copy_context().run, _process_one_video, config, video_uri
+      )
+      running_tasks.add(task)
+      tasks[task] = video_uri
+
+  # Report the errors of every video, a failed video doesn't stop the others
+  failed_video_uris = []
+  for task, video_uri in tasks.items():
+    try:
+      task.result()
+    except Exception as ex:
+      logging.exception("ERROR: video %s failed: %s", video_uri, ex)
+      failed_video_uris.append(video_uri)
+
+  if failed_video_uris:
+    logging.error(
+        "ABCD assessment failed for %s video(s): %s",
+        len(failed_video_uris),
+        ", ".join(failed_video_uris),
+    )
 
-  for video_uri in video_uris:
 
-    # Validate that creative provides match the video uris
-    if (
-        config.creative_provider_type == models.CreativeProviderType.GCS
-        and "gs://" not in video_uri
-    ):
-      logging.error(
-          "The creative provider GCS does not match with the video uri"
-          f" {video_uri}. Stopping execution. Please check."
-      )
-      break
+def _process_one_video(config: Configuration, video_uri: str) -> None:
+  """Execute ABCD Assessment for a single video"""
 
-    if (
-        config.creative_provider_type == models.CreativeProviderType.YOUTUBE
-        and "https://www.youtube.com" not in video_uri
-    ):
-      logging.error(
-          "The creative provider YOUTUBE does not match with the video uri"
-          f" {video_uri}. Stopping execution. Please check."
-      )
-      break
+  # Evaluations may overwrite brand details and LLM params on the config, so
+  # each video works on its own copy
+  config = copy.copy(config)
+  config.llm_params = copy.deepcopy(config.llm_params)
 
-    logging.info(f"Processing ABCD Assessment for video {video_uri}...")
-    print(f"\n\nProcessing ABCD Assessment for video {video_uri}... \n")
+  logging.info("Processing ABCD Assessment for video %s...", video_uri)
 
-    # Generate video annotations for custom features. Annotations are supported only for GCS providers
-    if (
-        config.use_annotations
-        and config.creative_provider_type == models.CreativeProviderType.GCS
-    ):
-      annotations_generation.generate_video_annotations(config, video_uri)
+  # Generate video annotations for custom features. Annotations are supported only for GCS providers
+  if config.use_annotations and config.is_gcs:
+    annotations_generation.generate_video_annotations(config, video_uri)
 
-    # Full ABCD features require 1st_5_secs videos only for GCS providers
-    if (
-        config.run_long_form_abcd
-        and config.creative_provider_type == models.CreativeProviderType.GCS
-    ):
-      generic_helpers.trim_video(config, video_uri)
+  # Extract brand metadata once, so Full ABCD and Shorts use the same details
+  if config.extract_brand_metadata:
+    video_evaluation_service.video_evaluation_service.set_brand_metadata(
+        config, video_uri
+    )
 
-    # Execute ABCD Assessment
-    long_form_abcd_evaluated_features: models.FeatureEvaluation = []
-    shorts_evaluated_features: models.FeatureEvaluation = []
+  # Execute ABCD Assessment. Full ABCD and Shorts are independent LLM
+  # evaluations, so run them concurrently to overlap their latencies
+  evaluate_features = functools.partial(
+      video_evaluation_service.video_evaluation_service.evaluate_features,
+      config=config,
+      video_uri=video_uri,
+  )
+  long_form_abcd_evaluated_features: list[models.FeatureEvaluation] = []
+  with ThreadPoolExecutor(max_workers=1) as executor:
+    # Shorts features only use the full video, so they don't wait for trimming
+    shorts_future = (
+        executor.submit(
+            contextvars.copy_context().run,
+            evaluate_features,
+            features_category=models.VideoFeatureCategory.SHORTS,
+        )
+        if config.run_shorts
+        else None
+    )
 
     if config.run_long_form_abcd:
-      long_form_abcd_evaluated_features = (
-          video_evaluation_service.video_evaluation_service.evaluate_features(
-              config=config,
-              video_uri=video_uri,
-              features_category=models.VideoFeatureCategory.LONG_FORM_ABCD,
-          )
-      )
+      # Full ABCD features require 1st_5_secs videos only for GCS providers
+      if config.is_gcs:
+        generic_helpers.trim_video(config, video_uri)
 
-    if config.run_shorts:
-      shorts_evaluated_features = (
-          video_evaluation_service.video_evaluation_service.evaluate_features(
-              config=config,
-              video_uri=video_uri,
-              features_category=models.VideoFeatureCategory.SHORTS,
-          )
+      long_form_abcd_evaluated_features = evaluate_features(
+          features_category=models.VideoFeatureCategory.LONG_FORM_ABCD,
       )
 
-    video_assessment: models.VideoAssessment = models.VideoAssessment(
-        brand_name=config.brand_name,
-        video_uri=video_uri,
-        long_form_abcd_evaluated_features=long_form_abcd_evaluated_features,
-        shorts_evaluated_features=shorts_evaluated_features,
-        config=config,
-    )
+  shorts_evaluated_features: list[models.FeatureEvaluation] = (
+      shorts_future.result() if shorts_future else []
+  )
 
-    # Print assessments for Full ABCD and Shorts and store results
-    if len(long_form_abcd_evaluated_features) > 0:
-      generic_helpers.print_abcd_assessment(
-          video_assessment.brand_name,
-          video_assessment.video_uri,
-          long_form_abcd_evaluated_features,
-      )
-    else:
-      logging.info(
-          "There are not Full ABCD evaluated features results to display."
-      )
-    if len(shorts_evaluated_features) > 0:
+  video_assessment: models.VideoAssessment = models.VideoAssessment(
+      brand_name=config.brand_name,
+      video_uri=video_uri,
+      long_form_abcd_evaluated_features=long_form_abcd_evaluated_features,
+      shorts_evaluated_features=shorts_evaluated_features,
+      config=config,
+  )
+
+  # Print assessments for Full ABCD and Shorts and store results
+  for label, evaluated_features in (
+      ("Full ABCD", long_form_abcd_evaluated_features),
+      ("Shorts", shorts_evaluated_features),
+  ):
+    if evaluated_features:
       generic_helpers.print_abcd_assessment(
           video_assessment.brand_name,
           video_assessment.video_uri,
-          shorts_evaluated_features,
+          evaluated_features,
       )
     else:
       logging.info(
-          "There are not Shorts evaluated features results to display."
+          "There are not %s evaluated features results to display.", label
       )
 
-    # Disable BQ as a whole
-    # if config.bq_table_name:
-    #   generic_helpers.store_in_bq(config, video_assessment)
-
-    # Remove local version of video files
-    generic_helpers.remove_local_video_files()
+  # Disable BQ as a whole
+  # if config.bq_table_name:
+  #   generic_helpers.store_in_bq(config, video_assessment)
 
 
 # NEW: changed to function
@@ -161,44 +201,50 @@ def analyse(
     arg_list: A list of command line arguments
 
   """
-  
-  buffer = io.StringIO()
+
+  # Fast paths that don't need to capture logs
+  if not video_uris:
+    return {"logs": "There are no videos to process.\n"}
 
   try:
-    # capture both stdout and stderr
-    with redirect_stdout(buffer), redirect_stderr(buffer):
-      config = utils.build_custom_config(
-        video_uris,
-        brand_name,
-        brand_variations,
-        branded_products,
-        branded_products_categories,
-        branded_call_to_actions
-      )
-      
-      if utils.invalid_brand_metadata(config):
-        print("Invalid brand metadata. Please provide brand details.\n")
-        return {"error": "Invalid brand metadata", "logs": buffer.getvalue()}
-      
-      start_time = time.time()
-      print("Starting ABCD assessment...\n")
-
-      if config.video_uris:
-        execute_abcd_assessment_for_videos(config)
-        print("Finished ABCD assessment.\n")
-      else:
-        print("There are no videos to process.\n")
-
-      print(f"ABCD assessment took {(time.time() - start_time)/60:.2f} mins.\n")
-    
+    config = utils.build_custom_config(
+      video_uris,
+      brand_name,
+      brand_variations,
+      branded_products,
+      branded_products_categories,
+      branded_call_to_actions
+    )
   except Exception as ex:
-    print("ERROR:", ex)
-    traceback.print_exc(file=buffer)
-  
+    return {
+        "error": "Invalid configuration",
+        "logs": f"ERROR: {ex}\n{traceback.format_exc()}",
+    }
+
+  if utils.invalid_brand_metadata(config):
+    return {
+        "error": "Invalid brand metadata",
+        "logs": "Invalid brand metadata. Please provide brand details.\n",
+    }
+
+  with logging_helpers.capture_logs() as log_handler:
+    try:
+      start_time = time.perf_counter()
+      logging.info("Starting ABCD assessment...\n")
+
+      execute_abcd_assessment_for_videos(config)
+      logging.info("Finished ABCD assessment.\n")
+
+      elapsed_mins = (time.perf_counter() - start_time) / 60
+      logging.info("ABCD assessment took %.2f mins.\n", elapsed_mins)
+
+    except Exception as ex:
+      logging.exception("ERROR: %s", ex)
+
   # return all logs
-  return {"logs": buffer.getvalue()}
-    
-    
+  return {"logs": log_handler.getvalue()}
+
+
 def main(arg_list: list[str] | None = None) -> None:
   """Main ABCD Assessment execution. See docstring and args.
 
@@ -222,7 +268,7 @@ def main(arg_list: list[str] | None = None) -> None:
       logging.error("Please enable the option or define brand details. \n")
       return
 
-    start_time = time.time()
+    start_time = time.perf_counter()
     logging.info("Starting ABCD assessment... \n")
 
     if config.video_uris:
@@ -231,12 +277,10 @@ def main(arg_list: list[str] | None = None) -> None:
     else:
       logging.info("There are no videos to process. \n")
 
-    logging.info(
-        "ABCD assessment took - %s mins. - \n", (time.time() - start_time) / 60
-    )
+    elapsed_mins = (time.perf_counter() - start_time) / 60
+    logging.info("ABCD assessment took - %s mins. - \n", elapsed_mins)
   except Exception as ex:
-    logging.error("ERROR: %s", ex)
-    traceback.print_exc()
+    logging.exception("ERROR: %s", ex)
 
 
 # NEW: no more main executable -> given to fastAPI
@@ -20,6 +20,7 @@
 
 """Module to generate video annotations using the Video Intelligence API"""
 
+import functools
 from enum import Enum
 from google.cloud import videointelligence
 from google.cloud.videointelligence import VideoContext
@@ -40,6 +41,22 @@ class Annotations(Enum):
   SPEECH_ANNOTATIONS = "speech_annotations"
 
 
+@functools.cache
+def get_standard_video_client() -> (
+    videointelligence.VideoIntelligenceServiceClient
+):
+  """Gets the Video Intelligence client, reused to keep its gRPC channel"""
+  return videointelligence.VideoIntelligenceServiceClient()
+
+
+@functools.cache
+def get_custom_video_client() -> (
+    videointelligence2.VideoIntelligenceServiceClient
+):
+  """Gets the Video Intelligence v1 client, reused to keep its gRPC channel"""
+  return videointelligence2.VideoIntelligenceServiceClient()
+
+
 def standard_annotations_detection(
     video_client: videointelligence.VideoIntelligenceServiceClient,
     video_uri: str,
@@ -95,8 +112,8 @@ def custom_annotations_detection(
 def generate_video_annotations(config: Configuration, video_uri: str) -> None:
   """Generates video annotations for videos in Google Cloud Storage"""
 
-  standard_video_client = videointelligence.VideoIntelligenceServiceClient()
-  custom_video_client = videointelligence2.VideoIntelligenceServiceClient()
+  standard_video_client = get_standard_video_client()
+  custom_video_client = get_custom_video_client()
 
   # Face Detection
   face_config = videointelligence.FaceDetectionConfig(
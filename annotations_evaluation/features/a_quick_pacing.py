@@ -90,14 +90,17 @@ def detect(
 
   # Video API: Evaluate quick_pacing_feature and quick_pacing_1st_5_secs_feature
   if "shot_annotations" in shot_annotation_results:
+    # Calculate each start time only once, for both sorting and evaluation
     sorted_shots = sorted(
-        shot_annotation_results.get("shot_annotations"),
-        key=lambda x: calculate_time_seconds(x, "start_time_offset"),
+        (
+            (calculate_time_seconds(shot, "start_time_offset"), shot)
+            for shot in shot_annotation_results.get("shot_annotations")
+        ),
+        key=lambda timed_shot: timed_shot[0],
         reverse=False,
     )
     # Video API: Evaluate quick_pacing_feature & quick_pacing_1st_5_secs_feature
-    for shot in sorted_shots:
-      start_time_secs = calculate_time_seconds(shot, "start_time_offset")
+    for start_time_secs, shot in sorted_shots:
       end_time_secs = calculate_time_seconds(shot, "end_time_offset")
       shot_total_time = end_time_secs - start_time_secs
       # Quick Pacing calculation
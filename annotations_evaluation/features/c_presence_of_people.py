@@ -25,7 +25,7 @@ Annotations used:
 
 from annotations_evaluation.annotations_generation import Annotations
 from gcp_api_services.gcs_api_service import gcs_api_service
-from helpers.annotations_helpers import calculate_time_seconds
+from helpers.annotations_helpers import get_track_arrays
 from configuration import Configuration
 
 
@@ -93,20 +93,27 @@ def detect(
   # Video API: Evaluate presence_of_people_feature and presence_of_people_1st_5_secs_feature
   if "person_detection_annotations" in people_annotation_results:
     # Video API: Evaluate presence_of_people_feature and presence_of_people_1st_5_secs_feature
-    for people_annotation in people_annotation_results.get(
-        "person_detection_annotations"
-    ):
-      for track in people_annotation.get("tracks"):
-        # Check confidence against user defined threshold
-        if track.get("confidence") >= config.confidence_threshold:
-          presence_of_people = True
-          start_time_secs = calculate_time_seconds(
-              track.get("segment"), "start_time_offset"
-          )
-          if start_time_secs < config.early_time_seconds:
-            presence_of_people_1st_5_secs = True
-          # Each segment includes track.get("timestamped_objects") that include
-          # characteristics - -e.g.clothes, posture of the person detected.
+    # Each track includes track.get("timestamped_objects") that include
+    # characteristics - -e.g.clothes, posture of the person detected.
+    # Check confidence against user defined threshold
+    tracks = get_track_arrays(
+        [
+            track
+            for people_annotation in people_annotation_results.get(
+                "person_detection_annotations"
+            )
+            for track in people_annotation.get("tracks")
+        ],
+        config.confidence_threshold,
+    )
+    confident_tracks = tracks.confident
+    presence_of_people = bool(confident_tracks.any())
+    presence_of_people_1st_5_secs = bool(
+        (
+            confident_tracks
+            & (tracks.start_times < config.early_time_seconds)
+        ).any()
+    )
   else:
     print(
         f"No People annotations found. Skipping {feature_name} evaluation with"
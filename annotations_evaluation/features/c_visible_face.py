@@ -25,7 +25,10 @@ Annotations used:
 
 from annotations_evaluation.annotations_generation import Annotations
 from gcp_api_services.gcs_api_service import gcs_api_service
-from helpers.annotations_helpers import calculate_time_seconds
+from helpers.annotations_helpers import (
+    get_bounding_box_arrays,
+    get_track_arrays,
+)
 from configuration import Configuration
 
 
@@ -93,28 +96,27 @@ def detect(
   if "face_detection_annotations" in face_annotation_results:
     # Video API: Evaluate visible_face_1st_5_secs_feature and visible_face_close_up_feature
     if face_annotation_results.get("face_detection_annotations"):
-      for annotation in face_annotation_results.get(
-          "face_detection_annotations"
-      ):
-        for track in annotation.get("tracks"):
-          start_time_secs = calculate_time_seconds(
-              track.get("segment"), "start_time_offset"
+      face_tracks = [
+          track
+          for annotation in face_annotation_results.get(
+              "face_detection_annotations"
           )
-          # Check confidence against user defined threshold
-          if track.get("confidence") >= config.confidence_threshold:
-            if start_time_secs < config.early_time_seconds:
-              visible_face_1st_5_secs = True
-            for face_object in track.get("timestamped_objects"):
-              box = face_object.get("normalized_bounding_box")
-              left = box.get("left") or 0
-              right = box.get("right") or 1
-              top = box.get("top") or 0
-              bottom = box.get("bottom") or 1
-              width = right - left
-              height = bottom - top
-              surface = width * height
-              if surface >= config.face_surface_threshold:
-                visible_face_close_up = True
+          for track in annotation.get("tracks")
+      ]
+      # Check confidence against user defined threshold
+      tracks = get_track_arrays(face_tracks, config.confidence_threshold)
+      confident_tracks = tracks.confident
+      # Only faces in confident tracks count as close ups
+      boxes = get_bounding_box_arrays(face_tracks, confident_tracks)
+      visible_face_1st_5_secs = bool(
+          (
+              confident_tracks
+              & (tracks.start_times < config.early_time_seconds)
+          ).any()
+      )
+      visible_face_close_up = bool(
+          (boxes.get_surfaces() >= config.face_surface_threshold).any()
+      )
   else:
     print(
         f"No Face annotations found. Skipping {feature_name} evaluation with"
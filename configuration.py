@@ -57,6 +57,8 @@ class Configuration:
     self.run_shorts: bool = True
     self.features_to_evaluate: list[str]  # list of feature ids to run
     self.creative_provider_type = CreativeProviderType.GCS  # GCS by default
+    self.is_gcs: bool = True
+    self.is_youtube: bool = False
 
     # set videos
     self.video_uris: list[str] = []
@@ -134,6 +136,12 @@ class Configuration:
     if creative_provider_type == CreativeProviderType.YOUTUBE.value:
       self.creative_provider_type = CreativeProviderType.YOUTUBE
 
+    # Cache the provider kind to avoid enum comparisons for every video
+    self.is_gcs = self.creative_provider_type is CreativeProviderType.GCS
+    self.is_youtube = (
+        self.creative_provider_type is CreativeProviderType.YOUTUBE
+    )
+
     self.annotation_path = f"gs://{bucket_name}/ABCD/"
 
   def set_videos(self, video_uris: list) -> None:
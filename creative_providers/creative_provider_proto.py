@@ -27,7 +27,7 @@ For example:
     - YoutubeProviderService - retrieves uris from Youtube
 """
 
-from typing import Protocol
+from typing import Iterator, Protocol
 import configuration
 
 
@@ -37,8 +37,11 @@ class CreativeProviderProto(Protocol):
   def __init__(self):
     pass
 
-  def get_creative_uris(self, config: configuration.Configuration) -> list[str]:
+  def get_creative_uris(
+      self, config: configuration.Configuration
+  ) -> Iterator[str]:
     """Implements specific logic depending on the provider
-    to retrieve creative uris to process
+    to retrieve creative uris to process. Uris are yielded lazily
+    so processing can start before all the creatives are listed.
     """
     pass
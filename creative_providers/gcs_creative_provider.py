@@ -22,9 +22,12 @@
 creative uris from GCS
 """
 
+from typing import Iterator
 from gcp_api_services import gcs_api_service
 import configuration
 
+LIST_BLOBS_PAGE_SIZE = 100
+
 
 class GCSCreativeProvider:
   """Class that implements the creative provider to
@@ -34,16 +37,20 @@ class GCSCreativeProvider:
   def __init__(self):
     pass
 
-  def get_creative_uris(self, config: configuration.Configuration) -> any:
+  def get_creative_uris(
+      self, config: configuration.Configuration
+  ) -> Iterator[str]:
     """Expands any GCS URI entry that is a folder path into its files."""
     for uri in config.video_uris:
       if uri.endswith("/"):
         print(f"EXPANDING URI: {uri} \n")
         bucket, prefix = uri.replace("gs://", "").split("/", 1)
-        for blob in (
-            gcs_api_service.gcs_api_service.get_client()
-            .get_bucket(bucket)
-            .list_blobs(prefix=prefix, delimiter="/")
+        # Blobs are fetched page by page as the uris are consumed
+        for blob in gcs_api_service.gcs_api_service.get_client().list_blobs(
+            bucket,
+            prefix=prefix,
+            delimiter="/",
+            page_size=LIST_BLOBS_PAGE_SIZE,
         ):
           if not blob.name.endswith("/"):
             yield f"gs://{bucket}/{blob.name}"
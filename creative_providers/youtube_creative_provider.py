@@ -2,6 +2,7 @@
 creative uris from Youtube
 """
 
+from typing import Iterator
 import configuration
 
 
@@ -13,6 +14,8 @@ class YoutubeCreativeProvider:
   def __init__(self):
     pass
 
-  def get_creative_uris(self, config: configuration.Configuration) -> any:
+  def get_creative_uris(
+      self, config: configuration.Configuration
+  ) -> Iterator[str]:
     """Get Youtube URLs"""
-    return config.video_uris
+    yield from config.video_uris
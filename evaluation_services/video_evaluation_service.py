@@ -17,6 +17,25 @@ class VideoEvaluationService:
   def __init__(self):
     pass
 
+  def set_brand_metadata(
+      self,
+      config: configuration.Configuration,
+      video_uri: str,
+  ) -> None:
+    """Extract the brand details from the video and set them in the config.
+    Called once per video, before the Full ABCD and Shorts evaluations.
+    """
+    metadata = llms_detector.llms_detector.get_video_metadata(
+        config, video_uri
+    )
+    config.brand_name = metadata.get("brand_name")
+    config.brand_variations = metadata.get("brand_variations")
+    config.branded_products = metadata.get("branded_products")
+    config.branded_products_categories = metadata.get(
+        "branded_products_categories"
+    )
+    config.branded_call_to_actions = metadata.get("branded_call_to_actions")
+
   def evaluate_features(
       self,
       config: configuration.Configuration,
@@ -25,18 +44,6 @@ class VideoEvaluationService:
   ):
     """Run ABCD evaluation on videos for Full ABCD features or Shorts"""
 
-    if config.extract_brand_metadata:
-      metadata = llms_detector.llms_detector.get_video_metadata(
-          config, video_uri
-      )
-      config.brand_name = metadata.get("brand_name")
-      config.brand_variations = metadata.get("brand_variations")
-      config.branded_products = metadata.get("branded_products")
-      config.branded_products_categories = metadata.get(
-          "branded_products_categories"
-      )
-      config.branded_call_to_actions = metadata.get("branded_call_to_actions")
-
     feature_evaluations: list[models.FeatureEvaluation] = []
     tasks = []
     feature_groups = feature_configs_handler.features_configs_handler.get_features_by_category_by_group_config(
@@ -58,7 +65,7 @@ class VideoEvaluationService:
       if (
           group_key == "NO_GROUPING"
           and config.use_annotations
-          and config.creative_provider_type == models.CreativeProviderType.GCS
+          and config.is_gcs
           # For now only GCS creative providers using annotations can be processed individually
       ):
         for f_config in feature_configs:
@@ -100,7 +107,7 @@ class VideoEvaluationService:
         # Use full video for Public URL videos
         if (
             group_key == models.VideoSegment.FIRST_5_SECS_VIDEO.value
-            and config.creative_provider_type == models.CreativeProviderType.GCS
+            and config.is_gcs
         ):
           uri = gcs_api_service.gcs_api_service.get_reduced_uri(
               config, video_uri
@@ -20,6 +20,7 @@
 
 """BigQuery service to write data to BigQuery using the specified client."""
 
+import functools
 from google.cloud import bigquery
 from google.cloud import exceptions as cloud_exceptions
 
@@ -29,6 +30,7 @@ class BigQueryAPIService:
 
   def __init__(self, project_id):
     self.gcs_project_id = project_id
+    self.client = bigquery.Client(project=project_id)
 
   def __get_full_table_name(self, dataset_name: str, table_name: str) -> str:
     """Generates a full table name by concatenating project, dataset, and table.
@@ -54,7 +56,6 @@ class BigQueryAPIService:
       dataset_name: The name of the dataset to create.
       location: The location where the table will be created
     """
-    client = bigquery.Client()
     full_dataset_name = self.__get_full_dataset_name(dataset_name)
     # Construct a full Dataset object to send to the API.
     dataset = bigquery.Dataset(full_dataset_name)
@@ -62,7 +63,7 @@ class BigQueryAPIService:
     # Raises google.api_core.exceptions.Conflict if the Dataset already exists
     try:
       # Send the dataset to the API for creation, with an explicit timeout.
-      dataset = client.create_dataset(dataset, timeout=30)
+      dataset = self.client.create_dataset(dataset, timeout=30)
       dataset_created = True if dataset and dataset.dataset_id else False
       if dataset_created:
         print(f"The dataset {full_dataset_name} was successfully created. \n")
@@ -81,11 +82,10 @@ class BigQueryAPIService:
       table_name: The name of the table to create.
       schema: The schema for the table.
     """
-    client = bigquery.Client(project=self.gcs_project_id)
     full_table_name = self.__get_full_table_name(dataset_name, table_name)
     table = bigquery.Table(full_table_name, schema=schema)
     try:
-      table = client.create_table(table)
+      table = self.client.create_table(table)
       table_created = True if table and table.full_table_id else False
       if table_created:
         print(f"The table {full_table_name} was successfully created. \n")
@@ -100,10 +100,9 @@ class BigQueryAPIService:
       dataset_name: The dataset containing the table.
       table_name: The name of the table to delete.
     """
-    client = bigquery.Client()
     full_table_name = self.__get_full_table_name(dataset_name, table_name)
     try:
-      table = client.get_table(full_table_name)
+      table = self.client.get_table(full_table_name)
       return table
     except cloud_exceptions.NotFound:
       print(f"Table {full_table_name} not found!")
@@ -115,12 +114,11 @@ class BigQueryAPIService:
       dataset_name: the dataset containing the table
       table_name: The name of the table to delete.
     """
-    client = bigquery.Client()
     full_table_name = self.__get_full_table_name(dataset_name, table_name)
     # If the table does not exist, delete_table raises
     # google.api_core.exceptions.NotFound unless not_found_ok is True.
     try:
-      client.delete_table(full_table_name, not_found_ok=True)
+      self.client.delete_table(full_table_name, not_found_ok=True)
       print(f"Deleted table {full_table_name}")
     except cloud_exceptions.NotFound:
       print(f"Table {full_table_name} not found!")
@@ -139,19 +137,18 @@ class BigQueryAPIService:
       table_name: The name of the table to create.
       dataframe: A list of user roles
     """
-    client = bigquery.Client(project=self.gcs_project_id)
     full_table_name = self.__get_full_table_name(dataset_name, table_name)
     job_config = bigquery.LoadJobConfig(
         schema=schema, write_disposition=write_disposition
     )
     # Make API request to load data
-    job = client.load_table_from_dataframe(
+    job = self.client.load_table_from_dataframe(
         dataframe, full_table_name, job_config=job_config
     )
     # Wait for the job to complete.
     job.result()
     # Check if table was created
-    table = client.get_table(full_table_name)
+    table = self.client.get_table(full_table_name)
     if table:
       print(
           f"Rows inserted in {full_table_name} successfully! Total rows in"
@@ -162,3 +159,11 @@ class BigQueryAPIService:
           "There was an error loading the users to the table"
           f" {full_table_name}. The table could not be created."
       )
+
+
+@functools.cache
+def get_bigquery_api_service(project_id: str) -> BigQueryAPIService:
+  """Gets a BigQuery service, reused across videos to keep its client
+  connections and credentials warm
+  """
+  return BigQueryAPIService(project_id)
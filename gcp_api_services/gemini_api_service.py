@@ -22,6 +22,7 @@
 
 import time
 import json
+import functools
 import vertexai
 import vertexai.preview.generative_models as generative_models
 from vertexai.preview.generative_models import GenerativeModel, Part, GenerationConfig
@@ -36,6 +37,14 @@ from models import LLMParameters
 DEFAULT_CONFIG = LLMParameters()
 
 
+@functools.cache
+def get_genai_client(project_id: str, location: str) -> genai.Client:
+  """Gets a GenAI client, reused across requests to keep its connections
+  and credentials warm
+  """
+  return genai.Client(vertexai=True, project=project_id, location=location)
+
+
 class GeminiAPIService:
   """Gemini API Service to leverage the Vertex APIs for inference"""
 
@@ -52,11 +61,7 @@ class GeminiAPIService:
     retries = 3
     for this_retry in range(retries):
       try:
-        client = genai.Client(
-            vertexai=True,
-            project=self.project_id,
-            location=llm_params.location,
-        )
+        client = get_genai_client(self.project_id, llm_params.location)
         # Build prompt parts
         contents = self._get_modality_params_genai(
             prompt_config.prompt, llm_params
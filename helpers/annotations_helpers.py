@@ -20,9 +20,38 @@
 
 """Module to load helper functions to process annotations"""
 
+from dataclasses import dataclass
+import numpy as np
 from configuration import Configuration
 
 
+@dataclass
+class TrackArrays:
+  """Tracks of an annotation type stored as a struct of arrays, one element
+  per track, so they can be evaluated with vectorized masks
+  """
+
+  start_times: np.ndarray
+  confident: np.ndarray  # tracks at or above the confidence threshold
+
+
+@dataclass
+class BoundingBoxArrays:
+  """Normalized bounding boxes of the timestamped objects in a list of tracks
+  stored as a struct of arrays, one element per object
+  """
+
+  track_ids: np.ndarray
+  left: np.ndarray
+  top: np.ndarray
+  right: np.ndarray
+  bottom: np.ndarray
+
+  def get_surfaces(self) -> np.ndarray:
+    """Get the surface of each bounding box"""
+    return (self.right - self.left) * (self.bottom - self.top)
+
+
 def calculate_time_seconds(part_obj: dict, part: str) -> float:
   """Calculate time of the provided part of the video
   Args:
@@ -35,14 +64,99 @@ def calculate_time_seconds(part_obj: dict, part: str) -> float:
     print(f"There is no part time {part} in {part_obj}")
     # TODO (ae) check this later
     return 0
+  part_time = part_obj[part]
   time_seconds = (
-      (part_obj.get(part).get("seconds") or 0)
-      + ((part_obj.get(part).get("microseconds") or 0) / 1e6)
-      + ((part_obj.get(part).get("nanos") or 0) / 1e9)
+      (part_time.get("seconds") or 0)
+      + ((part_time.get("microseconds") or 0) / 1e6)
+      + ((part_time.get("nanos") or 0) / 1e9)
   )
   return time_seconds
 
 
+def get_track_arrays(
+    tracks: list[dict], confidence_threshold: float
+) -> TrackArrays:
+  """Get the start times and confidence mask of a list of tracks as arrays
+  Segments are only read for confident tracks, other start times are NaN.
+  Args:
+      tracks: the tracks of an annotation type
+      confidence_threshold: the min confidence of a confident track
+  Returns:
+      track_arrays: the tracks as a struct of arrays
+  """
+  # Values are float64 like the Python floats loaded from the annotations, so
+  # comparisons against the thresholds match evaluating the tracks one by one
+  confident = (
+      np.array([track.get("confidence") for track in tracks], dtype=np.float64)
+      >= confidence_threshold
+  )
+  start_times = np.array(
+      [
+          calculate_time_seconds(track.get("segment"), "start_time_offset")
+          if is_confident
+          else np.nan
+          for track, is_confident in zip(tracks, confident)
+      ],
+      dtype=np.float64,
+  )
+  return TrackArrays(start_times=start_times, confident=confident)
+
+
+def get_bounding_box_arrays(
+    tracks: list[dict], track_mask: np.ndarray
+) -> BoundingBoxArrays:
+  """Get the bounding boxes of the timestamped objects in a list of tracks
+  Only the tracks selected by the mask are read. Missing edges default to the
+  frame borders.
+  Args:
+      tracks: the tracks of an annotation type
+      track_mask: the tracks to read the bounding boxes for
+  Returns:
+      bounding_box_arrays: the bounding boxes as a struct of arrays
+  """
+  track_ids = []
+  edges = []
+  for track_id in np.flatnonzero(track_mask):
+    for timestamped_object in tracks[track_id].get("timestamped_objects"):
+      box = timestamped_object.get("normalized_bounding_box")
+      track_ids.append(track_id)
+      edges.append((
+          box.get("left") or 0,
+          box.get("top") or 0,
+          box.get("right") or 1,
+          box.get("bottom") or 1,
+      ))
+  edges = np.array(edges, dtype=np.float64).reshape(-1, 4)
+  return BoundingBoxArrays(
+      track_ids=np.array(track_ids, dtype=np.int32),
+      left=edges[:, 0],
+      top=edges[:, 1],
+      right=edges[:, 2],
+      bottom=edges[:, 3],
+  )
+
+
+def get_words_until(words: list[dict], max_time_seconds: float) -> list[str]:
+  """Get the words spoken up to a point in time, sorted by start time
+  Args:
+      words: the word annotations of a transcript alternative
+      max_time_seconds: the latest start time to include a word
+  Returns:
+      words_until: the words starting at or before max_time_seconds
+  """
+  # Calculate each start time only once, for both sorting and filtering
+  timed_words = [
+      (calculate_time_seconds(word_info, "start_time"), word_info)
+      for word_info in words
+  ]
+  timed_words.sort(key=lambda timed_word: timed_word[0])
+  return [
+      word_info.get("word")
+      for start_time_secs, word_info in timed_words
+      if start_time_secs <= max_time_seconds
+  ]
+
+
 def detected_text_in_first_5_seconds(
     config: Configuration, annotation: dict
 ) -> tuple[bool, any]:
@@ -102,6 +216,7 @@ def find_elements_in_transcript(
           and alternative.get("confidence") >= config.confidence_threshold
       ):
         transcript = alternative.get("transcript")
+        transcript_lower = transcript.lower()
         # Check if elements or elements categories are found in transcript
         # TODO (ae) filter out words with less than x chars? - DONE
         if apply_condition:
@@ -112,32 +227,25 @@ def find_elements_in_transcript(
           found_elements = [
               element
               for element in elements
-              if element.lower() in transcript.lower()
+              if element.lower() in transcript_lower
           ]
         found_elements_categories = [
             elements_category
             for elements_category in elements_categories
-            if elements_category.lower() in transcript.lower()
+            if elements_category.lower() in transcript_lower
         ]
         if len(found_elements) > 0 or len(found_elements_categories) > 0:
           element_mention_speech = True
         # For 1st 5 secs, check elements and elements_categories in words
         # since only the words[] contain times
         words = alternative.get("words") if "words" in alternative else []
-        # Sort words by time to construct correct transcript later
-        sorted_words = sorted(
-            words,
-            key=lambda x: calculate_time_seconds(x, "start_time"),
-            reverse=False,
+        words_1st_5_secs.extend(
+            get_words_until(words, config.early_time_seconds)
         )
-        for word_info in sorted_words:
-          start_time_secs = calculate_time_seconds(word_info, "start_time")
-          # Consider only words in the 1st 5 secs
-          if start_time_secs <= config.early_time_seconds:
-            words_1st_5_secs.append(word_info.get("word"))
 
   # Evaluate 1st 5 secs - Construct transcript from words
   transcript_1st_5_secs = " ".join(words_1st_5_secs)
+  transcript_1st_5_secs_lower = transcript_1st_5_secs.lower()
   if apply_condition:
     found_elements_1st_5_seconds = find_text_annotation_elements_in_transcript(
         elements, transcript_1st_5_secs
@@ -146,12 +254,12 @@ def find_elements_in_transcript(
     found_elements_1st_5_seconds = [
         element
         for element in elements
-        if element.lower() in transcript_1st_5_secs.lower()
+        if element.lower() in transcript_1st_5_secs_lower
     ]
   found_elements_categories_1st_5_seconds = [
       elements_category
       for elements_category in elements_categories
-      if elements_category.lower() in transcript_1st_5_secs.lower()
+      if elements_category.lower() in transcript_1st_5_secs_lower
   ]
   if (
       len(found_elements_1st_5_seconds) > 0
@@ -172,11 +280,12 @@ def find_text_annotation_elements_in_transcript(
       This is only needed when elements come from text annotations since
       words are sometimes 1 character only.
   """
+  transcript_lower = transcript.lower()
   found_elements = [
       element
       for element in elements
       # filter out words with less than 3 chars? - DONE
-      if len(element) > 3 and element.lower() in transcript.lower()
+      if len(element) > 3 and element.lower() in transcript_lower
   ]
   return found_elements
 
@@ -244,17 +353,9 @@ def get_speech_transcript_1st_5_secs(
         # For 1st 5 secs get transcript from words
         # since only the words[] contain times
         words = alternative.get("words") if "words" in alternative else []
-        # Sort words by time to construct correct transcript later
-        sorted_words = sorted(
-            words,
-            key=lambda x: calculate_time_seconds(x, "start_time"),
-            reverse=False,
+        words_1st_5_secs.extend(
+            get_words_until(words, config.early_time_seconds)
         )
-        for word_info in sorted_words:
-          start_time_secs = calculate_time_seconds(word_info, "start_time")
-          # Consider only words in the 1st 5 secs
-          if start_time_secs <= config.early_time_seconds:
-            words_1st_5_secs.append(word_info.get("word"))
   # Construct transcript from words
   transcript_1st_5_secs = " ".join(words_1st_5_secs)
   return transcript_1st_5_secs
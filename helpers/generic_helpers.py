@@ -20,9 +20,12 @@
 
 """Module to load generic helper functions"""
 
+import io
 import json
 import os
+import tempfile
 import urllib
+import contextvars
 import datetime
 from concurrent.futures import ThreadPoolExecutor
 import pandas
@@ -76,14 +79,6 @@ def get_knowledge_graph_entities(
     raise
 
 
-def remove_local_video_files():
-  """Removes local video files"""
-  if os.path.exists(FFMPEG_BUFFER):
-    os.remove(FFMPEG_BUFFER)
-  if os.path.exists(FFMPEG_BUFFER_REDUCED):
-    os.remove(FFMPEG_BUFFER_REDUCED)
-
-
 def trim_video(config: Configuration, video_uri: str):
   """Trims videos to create new versions of 5 secs
   Args:
@@ -97,34 +92,44 @@ def trim_video(config: Configuration, video_uri: str):
   print(f"REDUCED: {reduced_uri} \n")
   if reduced_blob is None:
     print(f"Shortening video {video_uri}. \n")
+    # Each call gets its own local copies, even for the same video, so
+    # concurrent trims can't overwrite or remove each other's files
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(FFMPEG_BUFFER)) as tmp:
+      buffer = os.path.join(tmp, os.path.basename(FFMPEG_BUFFER))
+      buffer_reduced = os.path.join(
+          tmp, os.path.basename(FFMPEG_BUFFER_REDUCED)
+      )
 
-    # download
-    with open(FFMPEG_BUFFER, "wb") as f:
-      blob = gcs_api_service.gcs_api_service.get_blob(video_uri)
-      if blob:
-        f.write(blob.download_as_string(client=None))
-      else:
-        msg = f"Video URI: {video_uri} does not exist. Skipping execution."
-        logging.error(msg)
-        raise ValueError(msg)
-
-    # trim
-    clip = VideoFileClip(FFMPEG_BUFFER)
-    clip = clip.subclip(0, 5)
-    clip.write_videofile(FFMPEG_BUFFER_REDUCED)
-
-    # upload
-    gcs_api_service.gcs_api_service.upload_blob(
-        reduced_uri, FFMPEG_BUFFER_REDUCED
-    )
+      # download
+      with open(buffer, "wb") as f:
+        blob = gcs_api_service.gcs_api_service.get_blob(video_uri)
+        if blob:
+          f.write(blob.download_as_string(client=None))
+        else:
+          msg = f"Video URI: {video_uri} does not exist. Skipping execution."
+          logging.error(msg)
+          raise ValueError(msg)
+
+      # trim. moviepy writes its temp audio file to the current directory
+      # by default, which is shared by concurrent trims
+      clip = VideoFileClip(buffer)
+      try:
+        clip.subclip(0, 5).write_videofile(
+            buffer_reduced, temp_audiofile=os.path.join(tmp, "audio.mp3")
+        )
+      finally:
+        clip.close()
+
+      # upload
+      gcs_api_service.gcs_api_service.upload_blob(reduced_uri, buffer_reduced)
 
   else:
     print(f"Video {video_uri} has already been trimmed. Skipping...\n")
 
 
-def player(video_url: str):
+def player(video_url: str, file: io.TextIOBase | None = None):
   """Placeholder function to test locally"""
-  print(f"{video_url} \n")
+  print(f"{video_url} \n", file=file)
 
 
 def print_abcd_assessment(
@@ -132,18 +137,24 @@ def print_abcd_assessment(
     video_uri: str,
     evaluated_features: list[models.FeatureEvaluation],
 ) -> None:
-  """Print ABCD Assessments"""
+  """Print ABCD Assessments
+  The report is printed in a single write, so reports of videos evaluated
+  concurrently don't interleave.
+  """
+  report = io.StringIO()
   bucket_name, path = video_uri.replace("gs://", "").split("/", 1)
   video_url = f"/content/{bucket_name}/{path}"
   # Play Video
-  player(video_url)
-  print(f"***** ABCD Assessment for brand {brand_name} ***** \n")
-  print(f"Asset name: {video_uri} \n")
-  print_score_details(evaluated_features)
+  player(video_url, file=report)
+  print(f"***** ABCD Assessment for brand {brand_name} ***** \n", file=report)
+  print(f"Asset name: {video_uri} \n", file=report)
+  print_score_details(evaluated_features, file=report)
+  print(report.getvalue(), end="")
 
 
 def print_score_details(
     evaluated_features: list[models.FeatureEvaluation],
+    file: io.TextIOBase | None = None,
 ) -> None:
   """Print score details"""
   total_features = len(evaluated_features)
@@ -153,22 +164,23 @@ def print_score_details(
   score = calculate_score(evaluated_features)
   print(
       f"Video score: {round(score, 2)}%, adherence"
-      f" ({total_features_detected}/{total_features})\n"
+      f" ({total_features_detected}/{total_features})\n",
+      file=file,
   )
   if score >= 80:
-    print("Asset result: ✅ Excellent \n")
+    print("Asset result: ✅ Excellent \n", file=file)
   elif score >= 65 and score < 80:
-    print("Asset result: ⚠ Might Improve \n")
+    print("Asset result: ⚠ Might Improve \n", file=file)
   else:
-    print("Asset result: ❌ Needs Review \n")
+    print("Asset result: ❌ Needs Review \n", file=file)
 
-  print("Evaluated Features: \n")
+  print("Evaluated Features: \n", file=file)
   for eval_feature in evaluated_features:
     if eval_feature.detected:
-      print(f" * ✅ {eval_feature.feature.name}")
+      print(f" * ✅ {eval_feature.feature.name}", file=file)
     else:
-      print(f" * ❌ {eval_feature.feature.name}")
-  print("\n")
+      print(f" * ❌ {eval_feature.feature.name}", file=file)
+  print("\n", file=file)
 
 
 def get_call_to_action_api_list() -> list[str]:
@@ -397,7 +409,9 @@ def store_in_bq(
       f"Storing ABCD assessment for video {video_assessment.video_uri} in"
       " BigQuery... \n"
   )
-  bq_api_service = bigquery_api_service.BigQueryAPIService(config.project_id)
+  bq_api_service = bigquery_api_service.get_bigquery_api_service(
+      config.project_id
+  )
   assessment_bq = build_features_for_bq(config, video_assessment)
 
   # Insert if there is any feature evaluation
@@ -502,7 +516,10 @@ def execute_tasks_in_parallel(tasks: list[any]) -> None:
   """Executes a list of tasks in parallel"""
   results = []
   with ThreadPoolExecutor() as executor:
-    running_tasks = [executor.submit(task) for task in tasks]
+    # Run each task in a copy of the caller context to keep its logs captured
+    running_tasks = [
+        executor.submit(contextvars.copy_context().run, task) for task in tasks
+    ]
     for running_task in running_tasks:
       results.append(running_task.result())
   return results
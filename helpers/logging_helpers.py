@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+
+###########################################################################
+#
+#  Copyright 2025 Google LLC
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+###########################################################################
+
+"""Module to load helper functions to capture execution logs"""
+
+import io
+import sys
+import logging
+import threading
+import collections
+import contextlib
+import contextvars
+
+MAX_LOG_RECORDS = 10000
+
+
+class RingBufferHandler(logging.Handler):
+  """Logging handler that keeps the latest formatted records in memory"""
+
+  def __init__(self, max_records: int = MAX_LOG_RECORDS):
+    super().__init__()
+    self.records = collections.deque(maxlen=max_records)
+
+  def emit(self, record: logging.LogRecord) -> None:
+    try:
+      self.records.append(self.format(record))
+    except Exception:
+      self.handleError(record)
+
+  def getvalue(self) -> str:
+    """Gets all the buffered records as a single string"""
+    return "\n".join(self.records)
+
+
+class HandlerStream(io.TextIOBase):
+  """Text stream that sends each written line to a logging handler.
+  Used to capture print statements from the ABCD modules and third party
+  libraries in the same buffer as the logging records.
+  """
+
+  def __init__(self, handler: logging.Handler, level: int = logging.INFO):
+    super().__init__()
+    self.handler = handler
+    self.level = level
+    self._pending = ""
+    self._lock = threading.Lock()
+
+  def writable(self) -> bool:
+    return True
+
+  def write(self, text: str) -> int:
+    # Lines of a single write are emitted together, without other records
+    with self._lock:
+      lines = (self._pending + text).split("\n")
+      self._pending = lines.pop()
+      for line in lines:
+        self._emit(line)
+    return len(text)
+
+  def flush(self) -> None:
+    with self._lock:
+      if self._pending:
+        self._emit(self._pending)
+        self._pending = ""
+
+  def handle(self, record: logging.LogRecord) -> None:
+    """Sends a logging record to the handler between written texts"""
+    with self._lock:
+      self.handler.handle(record)
+
+  def _emit(self, line: str) -> None:
+    self.handler.handle(
+        logging.makeLogRecord({
+            "msg": line,
+            "levelno": self.level,
+            "levelname": logging.getLevelName(self.level),
+        })
+    )
+
+
+class ContextStream(io.TextIOBase):
+  """Text stream that writes to the stream captured by the current context,
+  falling back to the original stream outside a capture.
+  """
+
+  def __init__(self, stream: io.TextIOBase):
+    super().__init__()
+    self.stream = stream
+
+  def writable(self) -> bool:
+    return True
+
+  @property
+  def encoding(self) -> str:
+    return getattr(self.stream, "encoding", "utf-8")
+
+  def write(self, text: str) -> int:
+    return self._get_target().write(text)
+
+  def flush(self) -> None:
+    self._get_target().flush()
+
+  def isatty(self) -> bool:
+    return self._get_target().isatty()
+
+  def fileno(self) -> int:
+    return self._get_target().fileno()
+
+  def _get_target(self) -> io.TextIOBase:
+    captured_stream = _captured_stream.get()
+    return self.stream if captured_stream is None else captured_stream
+
+
+class ContextHandler(logging.Handler):
+  """Logging handler that sends records to the handler captured by the
+  current context, if any. Only the ABCD records, logged on the root logger,
+  are captured. Third party libraries log on their own named loggers.
+  """
+
+  def emit(self, record: logging.LogRecord) -> None:
+    captured_stream = _captured_stream.get()
+    if captured_stream is not None and record.name == "root":
+      captured_stream.handle(record)
+
+
+_captured_stream: contextvars.ContextVar[HandlerStream | None] = (
+    contextvars.ContextVar("captured_stream", default=None)
+)
+_install_lock = threading.Lock()
+_installed = False
+
+
+def _install_context_streams() -> None:
+  """Routes stdout, stderr and root logging through the current context.
+  This is done once per process, captures then only set a context variable.
+  """
+  global _installed
+  with _install_lock:
+    if not _installed:
+      sys.stdout = ContextStream(sys.stdout)
+      sys.stderr = ContextStream(sys.stderr)
+      logging.getLogger().addHandler(ContextHandler())
+      _installed = True
+
+
+@contextlib.contextmanager
+def capture_logs(max_records: int = MAX_LOG_RECORDS):
+  """Captures logging records, stdout and stderr in a bounded buffer
+  Only output from the current context is captured, so concurrent captures
+  don't mix their logs. Use contextvars.copy_context to propagate the capture
+  to worker threads.
+  Args:
+      max_records: the max number of records to keep, older ones are dropped
+  Returns:
+      handler: the handler holding the captured logs
+  """
+  _install_context_streams()
+  handler = RingBufferHandler(max_records)
+  handler.setFormatter(logging.Formatter("%(message)s"))
+  stream = HandlerStream(handler)
+  token = _captured_stream.set(stream)
+  try:
+    yield handler
+  finally:
+    stream.flush()
+    _captured_stream.reset(token)
@@ -52,15 +52,16 @@ class LLMDetector:
     llm_params = LLMParameters()
     llm_params.model_name = config.llm_params.model_name
     llm_params.location = config.llm_params.location
-    llm_params.generation_config = config.llm_params.generation_config
+    # Set the required schema for the LLM response. The generation config is
+    # copied since Full ABCD and Shorts share the config of the video
+    llm_params.generation_config = {
+        **config.llm_params.generation_config,
+        "response_schema": VIDEO_RESPONSE_SCHEMA,
+    }
     # Set modality for API
     llm_params.set_modality(
         {"type": "video", "video_uri": evaluation_details.get("video_uri")}
     )
-    # Set the required schema for the LLM response
-    config.llm_params.generation_config["response_schema"] = (
-        VIDEO_RESPONSE_SCHEMA
-    )
     evaluated_features = get_gemini_api_service(
         config
     ).execute_gemini_with_genai(prompt_config, llm_params)
@@ -77,14 +78,19 @@ class LLMDetector:
   def get_video_metadata(self, config: Configuration, video_uri: str):
     print(f"Extracting brand metadata for video {video_uri}... \n")
     prompt_config = prompt_generator.get_metadata_prompt_config()
-    # Set modality for API
-    config.llm_params.set_modality({"type": "video", "video_uri": video_uri})
+    # Create new object here to avoid race condition when executing in parallel
+    llm_params = LLMParameters()
+    llm_params.model_name = config.llm_params.model_name
+    llm_params.location = config.llm_params.location
     # Set the required schema for the LLM response
-    config.llm_params.generation_config["response_schema"] = (
-        VIDEO_METADATA_RESPONSE_SCHEMA
-    )
+    llm_params.generation_config = {
+        **config.llm_params.generation_config,
+        "response_schema": VIDEO_METADATA_RESPONSE_SCHEMA,
+    }
+    # Set modality for API
+    llm_params.set_modality({"type": "video", "video_uri": video_uri})
     metadata = get_gemini_api_service(config).execute_gemini_with_genai(
-        prompt_config, config.llm_params
+        prompt_config, llm_params
     )
 
     return metadata
@@ -1,9 +1,14 @@
+import os
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
 from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse, JSONResponse, FileResponse
 
 from analyse import analyse
-import logging
 
 
 logging.basicConfig(
@@ -11,6 +16,11 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 
+# Assessments block for minutes, so they run here instead of on the event loop
+EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("ANALYSE_MAX_WORKERS", "4"))
+)
+
 app = FastAPI()
 
 @app.get("/", response_class=HTMLResponse)
@@ -22,12 +32,16 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 @app.post("/analyse")
 async def analyse_endpoint(request: Request):
     data = await request.json()
-    logs = analyse(
-        data.get("video_url"),
-        data.get("brand"),
-        data.get("brand_variations"),
-        data.get("products"),
-        data.get("categories"),
-        data.get("cta"),
+    logs = await asyncio.get_running_loop().run_in_executor(
+        EXECUTOR,
+        functools.partial(
+            analyse,
+            data.get("video_url"),
+            data.get("brand"),
+            data.get("brand_variations"),
+            data.get("products"),
+            data.get("categories"),
+            data.get("cta"),
+        ),
     )
     return JSONResponse(content=logs)
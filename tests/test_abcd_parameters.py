@@ -20,7 +20,7 @@
 
 """Module to test ABCD parameters"""
 
-from utils import build_abcd_params_config
+from utils import build_abcd_params_config, build_custom_config
 from dataclasses import dataclass
 
 
@@ -147,3 +147,40 @@ def test_not_empty_abcd_params():
   assert config.temperature is not None
   assert config.top_p is not None
   assert config.top_k is not None
+
+
+def test_custom_config_is_not_shared_between_calls():
+  """Tests that configs built from the same brand details are independent"""
+
+  brand_details = (
+      "Google",
+      "Google,google",
+      "Google pixel, Google pixel buds",
+      "phone, buds",
+      "buy it!, buy",
+  )
+  config = build_custom_config("gs://bucket/video_1.mp4", *brand_details)
+  other_config = build_custom_config("gs://bucket/video_2.mp4", *brand_details)
+
+  assert config is not other_config
+  assert config.video_uris == ["gs://bucket/video_1.mp4"]
+  assert other_config.video_uris == ["gs://bucket/video_2.mp4"]
+  assert config.brand_variations == ["Google", "google"]
+  assert config.llm_params is not other_config.llm_params
+  assert (
+      config.llm_params.generation_config
+      is not other_config.llm_params.generation_config
+  )
+
+
+def test_custom_config_reads_env_on_each_call(monkeypatch):
+  """Tests that cached configs pick up changes to the env vars"""
+
+  brand_details = ("Google", "", "", "", "")
+  monkeypatch.setenv("BUCKET", "bucket_1")
+  config = build_custom_config("gs://bucket_1/video.mp4", *brand_details)
+  monkeypatch.setenv("BUCKET", "bucket_2")
+  other_config = build_custom_config("gs://bucket_2/video.mp4", *brand_details)
+
+  assert config.bucket_name == "bucket_1"
+  assert other_config.bucket_name == "bucket_2"
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+
+###########################################################################
+#
+#    Copyright 2025 Google LLC
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#            https://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+###########################################################################
+
+"""Module to test the people and face annotation features"""
+
+import random
+from unittest import mock
+import pytest
+
+storage = pytest.importorskip("google.cloud.storage")
+pytest.importorskip("google.cloud.videointelligence")
+
+# pylint: disable=wrong-import-position
+from configuration import Configuration
+from helpers.annotations_helpers import calculate_time_seconds
+
+# The GCS service creates a storage client on import, which requires
+# credentials. Annotations are provided by each test instead.
+with mock.patch.object(storage, "Client"):
+  from annotations_evaluation.features import c_presence_of_people
+  from annotations_evaluation.features import c_visible_face
+
+VIDEO_URI = "gs://bucket/video.mp4"
+THRESHOLDS = [0.3, 0.5, 0.7]
+
+
+def loop_presence_of_people(config: Configuration, annotations: dict):
+  """Evaluates presence of people one track at a time"""
+  presence_of_people = False
+  presence_of_people_1st_5_secs = False
+  for people_annotation in annotations.get("person_detection_annotations"):
+    for track in people_annotation.get("tracks"):
+      if track.get("confidence") >= config.confidence_threshold:
+        presence_of_people = True
+        start_time_secs = calculate_time_seconds(
+            track.get("segment"), "start_time_offset"
+        )
+        if start_time_secs < config.early_time_seconds:
+          presence_of_people_1st_5_secs = True
+  return presence_of_people, presence_of_people_1st_5_secs
+
+
+def loop_visible_face(config: Configuration, annotations: dict):
+  """Evaluates visible face one track at a time"""
+  visible_face_1st_5_secs = False
+  visible_face_close_up = False
+  if annotations.get("face_detection_annotations"):
+    for annotation in annotations.get("face_detection_annotations"):
+      for track in annotation.get("tracks"):
+        if track.get("confidence") >= config.confidence_threshold:
+          start_time_secs = calculate_time_seconds(
+              track.get("segment"), "start_time_offset"
+          )
+          if start_time_secs < config.early_time_seconds:
+            visible_face_1st_5_secs = True
+          for face_object in track.get("timestamped_objects"):
+            box = face_object.get("normalized_bounding_box")
+            left = box.get("left") or 0
+            right = box.get("right") or 1
+            top = box.get("top") or 0
+            bottom = box.get("bottom") or 1
+            surface = (right - left) * (bottom - top)
+            if surface >= config.face_surface_threshold:
+              visible_face_close_up = True
+  return visible_face_1st_5_secs, visible_face_close_up
+
+
+def random_track(rng: random.Random) -> dict:
+  """Builds a track with values close to the thresholds"""
+  left, top = rng.choice([0, 0.1, 0.5]), rng.choice([0, 0.2, 0.5])
+  return {
+      "confidence": rng.choice(THRESHOLDS + [rng.random()]),
+      "segment": {
+          "start_time_offset": {
+              "seconds": rng.choice([0, 4, 5, 6]),
+              "nanos": rng.choice([0, 999999999]),
+          }
+      },
+      "timestamped_objects": [
+          {
+              "normalized_bounding_box": {
+                  "left": left,
+                  "top": top,
+                  "right": rng.choice([None, left + 0.5, 1]),
+                  "bottom": rng.choice([None, top + 0.3, 1]),
+              }
+          }
+          for _ in range(rng.randint(0, 3))
+      ],
+  }
+
+
+def build_config(confidence_threshold: float) -> Configuration:
+  """Builds a config with thresholds matching the random tracks"""
+  config = Configuration()
+  config.confidence_threshold = confidence_threshold
+  config.face_surface_threshold = 0.15
+  config.early_time_seconds = 5
+  return config
+
+
+def detect(monkeypatch, module, config: Configuration, annotations: dict):
+  """Runs the feature detection on the provided annotations"""
+  monkeypatch.setattr(
+      module.gcs_api_service, "load_blob", lambda uri: annotations
+  )
+  return module.detect(config, "feature", VIDEO_URI)
+
+
+@pytest.mark.parametrize("confidence_threshold", THRESHOLDS)
+def test_features_match_track_loops(monkeypatch, confidence_threshold):
+  """Tests that the masked evaluation matches evaluating track by track"""
+  rng = random.Random(0)
+  config = build_config(confidence_threshold)
+  for _ in range(500):
+    tracks = [random_track(rng) for _ in range(rng.randint(0, 6))]
+    people_annotations = {"person_detection_annotations": [{"tracks": tracks}]}
+    face_annotations = {"face_detection_annotations": [{"tracks": tracks}]}
+
+    assert detect(
+        monkeypatch, c_presence_of_people, config, people_annotations
+    ) == loop_presence_of_people(config, people_annotations)
+    assert detect(
+        monkeypatch, c_visible_face, config, face_annotations
+    ) == loop_visible_face(config, face_annotations)
+
+
+def test_features_without_tracks(monkeypatch):
+  """Tests that annotations without tracks detect nothing"""
+  config = build_config(0.5)
+  people_annotations = {"person_detection_annotations": [{"tracks": []}]}
+  face_annotations = {"face_detection_annotations": [{"tracks": []}]}
+
+  assert detect(
+      monkeypatch, c_presence_of_people, config, people_annotations
+  ) == (False, False)
+  assert detect(monkeypatch, c_visible_face, config, face_annotations) == (
+      False,
+      False,
+  )
+
+
+def test_features_at_threshold(monkeypatch):
+  """Tests that values equal to the thresholds are detected"""
+  config = build_config(0.7)
+  track = {
+      "confidence": 0.7,
+      "segment": {"start_time_offset": {"seconds": 4}},
+      "timestamped_objects": [{
+          "normalized_bounding_box": {
+              "left": 0.5,
+              "top": 0.7,
+              "right": 0.8,
+              "bottom": 1,
+          }
+      }],
+  }
+  people_annotations = {"person_detection_annotations": [{"tracks": [track]}]}
+  face_annotations = {"face_detection_annotations": [{"tracks": [track]}]}
+  config.face_surface_threshold = (0.8 - 0.5) * (1 - 0.7)
+
+  assert detect(
+      monkeypatch, c_presence_of_people, config, people_annotations
+  ) == (True, True)
+  assert detect(monkeypatch, c_visible_face, config, face_annotations) == (
+      True,
+      True,
+  )
+
+
+def test_features_skip_fields_of_low_confidence_tracks(monkeypatch):
+  """Tests that low confidence tracks without segments or objects are skipped"""
+  config = build_config(0.5)
+  tracks = [
+      {"confidence": 0.2},
+      {
+          "confidence": 0.9,
+          "segment": {"start_time_offset": {"seconds": 6}},
+          "timestamped_objects": [],
+      },
+  ]
+  people_annotations = {"person_detection_annotations": [{"tracks": tracks}]}
+  face_annotations = {"face_detection_annotations": [{"tracks": tracks}]}
+
+  assert detect(
+      monkeypatch, c_presence_of_people, config, people_annotations
+  ) == (True, False)
+  assert detect(monkeypatch, c_visible_face, config, face_annotations) == (
+      False,
+      False,
+  )
@@ -21,7 +21,9 @@
 """Utils Module for generic functions"""
 
 import os
+import copy
 import argparse
+import functools
 import textwrap
 from configuration import Configuration
 from dotenv import load_dotenv, find_dotenv
@@ -37,7 +39,7 @@ def build_custom_config(
     brand_variations,
     branded_products,
     branded_products_categories,
-    branded_call_to_actions    
+    branded_call_to_actions
 ) -> Configuration:
   """Builds ABCD configuration with all the required parameters.
 
@@ -46,12 +48,49 @@ def build_custom_config(
   Returns:
       config: The parameter configuration for ABCD.
 
+  """
+  # Env vars are part of the cache key, so changes to them are picked up
+  base_config = _build_brand_config(
+      os.getenv("PROJECT"),
+      os.getenv("REGION"),
+      os.getenv("BUCKET"),
+      brand_name,
+      brand_variations,
+      branded_products,
+      branded_products_categories,
+      branded_call_to_actions,
+  )
+  # The base config is shared between calls, so give each call its own
+  # copy. LLM params are the only attributes updated in place downstream.
+  config = copy.copy(base_config)
+  config.llm_params = copy.deepcopy(base_config.llm_params)
+  config.set_videos(video_uris)
+
+  return config
+
+
+@functools.lru_cache(maxsize=64)
+def _build_brand_config(
+    project_id,
+    project_zone,
+    bucket_name,
+    brand_name,
+    brand_variations,
+    branded_products,
+    branded_products_categories,
+    branded_call_to_actions,
+) -> Configuration:
+  """Builds the ABCD configuration that doesn't depend on the videos.
+
+  Cached since the same brand details are usually submitted for many videos.
+  The returned config must not be modified, see build_custom_config.
+
   """
   config = Configuration()
   config.set_parameters(
-      project_id=os.getenv("PROJECT"),
-      project_zone=os.getenv("REGION"),
-      bucket_name=os.getenv("BUCKET"),
+      project_id=project_id,
+      project_zone=project_zone,
+      bucket_name=bucket_name,
       knowledge_graph_api_key="", # ignore
       bigquery_dataset="", # ignore
       bigquery_table="", # ignore
@@ -65,7 +104,6 @@ def build_custom_config(
       creative_provider_type=CreativeProviderType.GCS,
       verbose=True,
   )
-  config.set_videos(video_uris)
   config.set_brand_details(
       brand_name=brand_name,
       brand_variations=brand_variations,